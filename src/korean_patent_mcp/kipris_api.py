@@ -2,16 +2,249 @@
 KIPRIS API Client for MCP Server
 한국 특허정보 검색서비스 API 클라이언트
 """
+import asyncio
+import functools
+import inspect
 import os
-import xml.etree.ElementTree as ET
-from typing import List, Dict, Optional, Any
+from collections import OrderedDict
+from time import monotonic
+from types import MappingProxyType
+from urllib.parse import urlencode
+from typing import List, Dict, Optional, Any, Callable, Hashable, Tuple
 from dataclasses import dataclass
 import httpx
 from dotenv import load_dotenv
+from lxml import etree
 
 load_dotenv()
 
 
+# 파싱된 XML 레코드: (태그명, {자식 태그: 텍스트})
+_Record = Tuple[str, Dict[str, Optional[str]]]
+
+
+# 엔드포인트별 고정 요청 파라미터 (호출마다 가변 파라미터만 덧붙인다)
+_APPLICANT_SEARCH_BASE = MappingProxyType({"patent": "true", "utility": "false"})
+_PATENT_INFO_BASE = MappingProxyType({"docsStart": "1"})
+
+# 응답 필드 매핑: (결과 키, XML 태그)
+_PATENT_FIELDS: Tuple[Tuple[str, str], ...] = (
+    ("application_number", "ApplicationNumber"),
+    ("application_date", "ApplicationDate"),
+    ("title", "InventionName"),
+    ("applicant", "Applicant"),
+    ("registration_status", "RegistrationStatus"),
+    # 공개 정보
+    ("opening_number", "OpeningNumber"),
+    ("opening_date", "OpeningDate"),
+    # 등록 정보
+    ("registration_number", "RegistrationNumber"),
+    ("registration_date", "RegistrationDate"),
+)
+
+_PATENT_DETAIL_FIELDS: Tuple[Tuple[str, str], ...] = _PATENT_FIELDS + (
+    ("abstract", "Abstract"),
+    ("ipc_number", "InternationalpatentclassificationNumber"),
+)
+
+_CITING_FIELDS: Tuple[Tuple[str, str], ...] = (
+    ("citing_application_number", "ApplicationNumber"),
+    ("standard_citation_number", "StandardCitationApplicationNumber"),
+    ("status_code", "StandardStatusCode"),
+    ("status_name", "StandardStatusCodeName"),
+    ("citation_type_code", "CitationLiteratureTypeCode"),
+    ("citation_type_name", "CitationLiteratureTypeCodeName"),
+)
+
+
+@dataclass(slots=True, frozen=True)
+class Patent:
+    """특허 기본 정보 (검색 결과 레코드, 필드명은 _PATENT_FIELDS의 결과 키)"""
+    application_number: Optional[str] = None
+    application_date: Optional[str] = None
+    title: Optional[str] = None
+    applicant: Optional[str] = None
+    registration_status: Optional[str] = None
+    opening_number: Optional[str] = None
+    opening_date: Optional[str] = None
+    registration_number: Optional[str] = None
+    registration_date: Optional[str] = None
+
+
+@dataclass(slots=True, frozen=True)
+class PatentDetail(Patent):
+    """특허 상세 정보 (필드명은 _PATENT_DETAIL_FIELDS의 결과 키)"""
+    abstract: Optional[str] = None
+    ipc_number: Optional[str] = None
+
+
+@dataclass(slots=True, frozen=True)
+class Citation:
+    """인용 특허 레코드 (필드명은 _CITING_FIELDS의 결과 키)"""
+    citing_application_number: Optional[str] = None
+    standard_citation_number: Optional[str] = None
+    status_code: Optional[str] = None
+    status_name: Optional[str] = None
+    citation_type_code: Optional[str] = None
+    citation_type_name: Optional[str] = None
+
+
+def _element_fields(elem: etree._Element) -> Dict[str, Optional[str]]:
+    """
+    엘리먼트를 {태그: 텍스트} 딕셔너리로 변환
+    
+    자식 엘리먼트는 한 번만 순회하며, 자식이 없는 엘리먼트는 자기 자신의 텍스트를 담는다.
+    """
+    if len(elem):
+        return {
+            child.tag: child.text.strip() if child.text else None
+            for child in elem.iterchildren(tag=etree.Element)
+        }
+    return {elem.tag: elem.text.strip() if elem.text else None}
+
+
+def _new_pull_parser(tags: Tuple[str, ...]) -> etree.XMLPullParser:
+    """
+    응답 하나를 파싱할 XMLPullParser 생성
+    
+    pull parser는 close() 이후 재사용할 수 없으므로 요청마다 만들되,
+    libxml2 파서 컨텍스트 재사용은 lxml 내부에 맡긴다.
+    XML이 아닌 응답(오류 메시지, 오류 페이지)이 빈 결과로 처리되어 캐시되지 않도록
+    recover 모드는 쓰지 않는다 (XMLSyntaxError 발생).
+    """
+    return etree.XMLPullParser(
+        events=("end",),
+        tag=tags,
+        huge_tree=False,
+        resolve_entities=False,
+        no_network=True,
+    )
+
+
+def _drain_events(parser: etree.XMLPullParser, records: List[_Record]) -> None:
+    """파서에 쌓인 end 이벤트를 레코드로 옮기고 엘리먼트를 비운다"""
+    for _, elem in parser.read_events():
+        records.append((elem.tag, _element_fields(elem)))
+        elem.clear(keep_tail=True)
+
+
+_MISSING = object()
+
+
+class _TTLCache:
+    """만료 시간(TTL)이 있는 LRU 캐시"""
+    
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+    
+    def get(self, key: Hashable) -> Any:
+        """캐시 조회 (없거나 만료되었으면 _MISSING 반환)"""
+        entry = self._data.get(key)
+        if entry is None:
+            return _MISSING
+        expires_at, value = entry
+        if expires_at < monotonic():
+            del self._data[key]
+            return _MISSING
+        self._data.move_to_end(key)
+        return value
+    
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """캐시 저장 (ttl 미지정 시 기본 TTL, 용량 초과 시 가장 오래 사용하지 않은 항목 제거)"""
+        ttl = min(self.ttl, ttl) if ttl is not None else self.ttl
+        if self.maxsize <= 0 or ttl <= 0:
+            return
+        self._data[key] = (monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+    
+    def clear(self) -> None:
+        self._data.clear()
+
+
+def _is_negative(value: Any) -> bool:
+    """조회 결과가 없음(None, 빈 목록, 결과 0건인 검색)인지 확인"""
+    if isinstance(value, dict) and "patents" in value:
+        return not value["patents"]
+    return not value
+
+
+def _ttl_cached(method: Callable) -> Callable:
+    """
+    클라이언트 조회 메서드의 결과를 TTL 캐시에 저장하는 데코레이터
+    
+    캐시 키는 기본값을 채운 인자 값으로 만들어 위치/키워드 인자 호출이 같은 키를 쓴다.
+    파라미터 이름과 기본값은 데코레이터 적용 시 한 번만 읽어 두고, 호출마다
+    inspect.Signature.bind를 거치지 않는다 (모든 인자를 위치 인자로 주면 그대로 키로 사용).
+    결과가 없는 응답은 잘못된 값이 오래 남지 않도록 짧은 TTL로 저장한다.
+    반환값은 호출자 간에 공유되므로 수정하지 않아야 한다.
+    """
+    name = method.__name__
+    params = list(inspect.signature(method).parameters.values())[1:]
+    names = tuple(param.name for param in params)
+    defaults = tuple(
+        _MISSING if param.default is param.empty else param.default for param in params
+    )
+    arity = len(names)
+    
+    def fill(args: tuple, kwargs: dict) -> tuple:
+        """키워드 인자와 기본값을 채워 위치 인자 튜플로 변환"""
+        if len(args) > arity:
+            raise TypeError(f"{name}() takes {arity} arguments but {len(args)} were given")
+        filled = list(args)
+        for param_name, default in zip(names[len(args):], defaults[len(args):]):
+            value = kwargs.pop(param_name, default)
+            if value is _MISSING:
+                raise TypeError(f"{name}() missing required argument: '{param_name}'")
+            filled.append(value)
+        if kwargs:
+            raise TypeError(f"{name}() got an unexpected keyword argument '{next(iter(kwargs))}'")
+        return tuple(filled)
+    
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        if kwargs or len(args) != arity:
+            args = fill(args, kwargs)
+        key = (name, *args)
+        value = self._cache.get(key)
+        if value is _MISSING:
+            value = await method(self, *args)
+            ttl = self.config.negative_cache_ttl if _is_negative(value) else None
+            self._cache.set(key, value, ttl)
+        return value
+    
+    return wrapper
+
+
+# 환경변수 -> KiprisConfig 필드 (비어 있으면 필드 기본값 사용)
+_ENV_FIELDS: Tuple[Tuple[str, str], ...] = (
+    ("KIPRIS_TIMEOUT", "timeout"),
+    ("KIPRIS_MAX_RETRIES", "max_retries"),
+    ("KIPRIS_CACHE_SIZE", "cache_size"),
+    ("KIPRIS_CACHE_TTL", "cache_ttl"),
+    ("KIPRIS_NEGATIVE_CACHE_TTL", "negative_cache_ttl"),
+    ("KIPRIS_PREFETCH_DEPTH", "prefetch_depth"),
+    ("KIPRIS_POOL_SIZE", "pool_size"),
+    ("KIPRIS_HTTP2", "http2"),
+)
+
+
+def _env_value(name: str, default: Any) -> Any:
+    """환경변수 값을 기본값과 같은 타입(int/bool)으로 변환"""
+    raw = os.getenv(name, "").strip()
+    if not raw:
+        return default
+    if isinstance(default, bool):
+        return raw.lower() in ("1", "true", "yes", "on")
+    try:
+        return int(raw)
+    except ValueError:
+        raise ValueError(f"{name} 환경변수는 정수여야 합니다: {raw!r}")
+
+
 @dataclass
 class KiprisConfig:
     """KIPRIS API 설정"""
@@ -19,17 +252,38 @@ class KiprisConfig:
     base_url: str = "http://plus.kipris.or.kr/openapi/rest"
     timeout: int = 30
     max_retries: int = 3
+    cache_size: int = 2048
+    cache_ttl: int = 3600
+    # 결과가 없는 응답의 캐시 유지 시간 (초)
+    negative_cache_ttl: int = 30
+    # 검색 후 백그라운드로 미리 조회할 다음 페이지 수 (0이면 사용 안 함)
+    prefetch_depth: int = 1
+    # HTTP 연결 풀 크기 (동시 연결 수 및 유지할 keep-alive 연결 수)
+    pool_size: int = 100
+    # HTTP/2 사용 여부 (https base_url에서만 유효, httpx[http2] 필요)
+    http2: bool = False
     
     @classmethod
-    def from_env(cls) -> "KiprisConfig":
-        """환경변수에서 설정 로드"""
-        api_key = os.getenv("KIPRIS_API_KEY", "")
+    def from_env(cls, api_key: Optional[str] = None) -> "KiprisConfig":
+        """
+        환경변수에서 설정 로드
+        
+        Args:
+            api_key: 사용할 API 키 (None이면 KIPRIS_API_KEY 환경변수)
+        
+        캐시, 연결 풀, 프리페치 등 나머지 설정은 KIPRIS_* 환경변수(_ENV_FIELDS)에서 읽는다.
+        """
+        if api_key is None:
+            api_key = os.getenv("KIPRIS_API_KEY", "")
         if not api_key:
             raise ValueError(
                 "KIPRIS_API_KEY 환경변수가 설정되지 않았습니다. "
                 ".env 파일에 KIPRIS_API_KEY=your_key 형식으로 추가하세요."
             )
-        return cls(api_key=api_key)
+        return cls(
+            api_key=api_key,
+            **{field: _env_value(name, getattr(cls, field)) for name, field in _ENV_FIELDS}
+        )
 
 
 class KiprisAPIClient:
@@ -54,47 +308,135 @@ class KiprisAPIClient:
             config: KIPRIS API 설정 (None이면 환경변수에서 로드)
         """
         self.config = config or KiprisConfig.from_env()
-        self.client = httpx.AsyncClient(timeout=self.config.timeout)
+        self._client: Optional[httpx.AsyncClient] = None
+        self._closed = False
+        self._cache = _TTLCache(self.config.cache_size, self.config.cache_ttl)
+        self._sem: Optional[asyncio.Semaphore] = None
+        self._inflight: Dict[Tuple[str, Tuple[str, ...]], "asyncio.Future[Optional[List[_Record]]]"] = {}
+    
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """
+        공유 HTTP 클라이언트 (최초 요청 시 실행 중인 이벤트 루프에서 생성)
+        
+        연결 풀을 재사용하여 요청마다 TCP 연결을 새로 맺지 않는다.
+        """
+        if self._client is None:
+            if self._closed:
+                # 종료 후 새 연결 풀을 만들면 아무도 닫지 않으므로 거부
+                raise RuntimeError("KIPRIS API 클라이언트가 이미 종료되었습니다. 다시 요청해주세요.")
+            # transport를 직접 지정하면 AsyncClient의 limits 인자는 무시되므로
+            # 연결 풀 설정은 반드시 transport에 전달한다 (재시도는 _fetch에서 처리)
+            self._client = httpx.AsyncClient(
+                timeout=self.config.timeout,
+                transport=httpx.AsyncHTTPTransport(
+                    limits=httpx.Limits(
+                        max_connections=self.config.pool_size,
+                        max_keepalive_connections=self.config.pool_size,
+                        keepalive_expiry=60,
+                    ),
+                    http2=self.config.http2,
+                    retries=0,
+                ),
+            )
+        return self._client
+    
+    @property
+    def request_semaphore(self) -> asyncio.Semaphore:
+        """
+        동시 upstream 요청 수 제한 (연결 풀 크기와 동일)
+        
+        풀보다 많은 요청이 몰려도 연결 대기(pool timeout) 오류 대신 순서를 기다린다.
+        """
+        if self._sem is None:
+            self._sem = asyncio.Semaphore(self.config.pool_size)
+        return self._sem
     
     async def close(self):
-        """HTTP 클라이언트 종료"""
-        await self.client.aclose()
+        """HTTP 클라이언트 종료 (이후 upstream 요청은 RuntimeError, 캐시 조회는 계속 가능)"""
+        self._closed = True
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
+    async def close_when_idle(self):
+        """진행 중인 요청이 모두 끝난 뒤 HTTP 클라이언트 종료"""
+        while self._inflight:
+            await asyncio.gather(*list(self._inflight.values()), return_exceptions=True)
+        await self.close()
+    
+    def clear_cache(self):
+        """조회 결과 캐시 비우기"""
+        self._cache.clear()
     
     async def _make_request(
         self, 
         endpoint: str, 
-        params: Dict[str, Any]
-    ) -> Optional[ET.Element]:
+        params: Dict[str, Any],
+        tags: Tuple[str, ...]
+    ) -> Optional[List[_Record]]:
         """
         API 요청 실행
         
         Args:
             endpoint: API 엔드포인트
             params: 요청 파라미터
+            tags: 응답에서 추출할 XML 태그
             
         Returns:
-            XML 루트 엘리먼트 또는 None
+            (태그명, 필드 딕셔너리) 레코드 목록 또는 None
+        """
+        # 쿼리 스트링을 한 번만 인코딩하여 완성된 URL로 요청 (인증키 포함, params는 변경하지 않음)
+        query = urlencode({**params, "accessKey": self.config.api_key})
+        url = f"{self.config.base_url}{endpoint}?{query}"
+        
+        # 동일한 요청이 진행 중이면 새로 보내지 않고 그 결과를 함께 기다린다 (single-flight)
+        key = (url, tags)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(url, tags))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # 한 호출자가 취소되어도 공유 요청은 계속 진행되도록 shield
+        return await asyncio.shield(task)
+    
+    async def _fetch(
+        self,
+        url: str,
+        tags: Tuple[str, ...]
+    ) -> Optional[List[_Record]]:
         """
-        url = f"{self.config.base_url}{endpoint}"
-        params["accessKey"] = self.config.api_key
+        재시도를 포함한 실제 HTTP 요청
         
-        for attempt in range(self.config.max_retries):
-            try:
-                response = await self.client.get(url, params=params)
-                if response.status_code == 200:
-                    return ET.fromstring(response.content)
-                else:
+        응답 본문 전체를 메모리에 올리지 않고, 도착하는 청크를 바로 XML 파서에 넣어
+        네트워크 수신과 파싱을 겹친다.
+        """
+        client = self.client
+        async with self.request_semaphore:
+            for attempt in range(self.config.max_retries):
+                try:
+                    async with client.stream("GET", url) as response:
+                        if response.status_code == 200:
+                            parser = _new_pull_parser(tags)
+                            records: List[_Record] = []
+                            async for chunk in response.aiter_bytes(65536):
+                                parser.feed(chunk)
+                                _drain_events(parser, records)
+                            parser.close()
+                            _drain_events(parser, records)
+                            return records
+                        else:
+                            if attempt == self.config.max_retries - 1:
+                                raise httpx.HTTPStatusError(
+                                    f"API 응답 오류: {response.status_code}",
+                                    request=response.request,
+                                    response=response
+                                )
+                except httpx.TimeoutException:
                     if attempt == self.config.max_retries - 1:
-                        raise httpx.HTTPStatusError(
-                            f"API 응답 오류: {response.status_code}",
-                            request=response.request,
-                            response=response
-                        )
-            except httpx.TimeoutException:
-                if attempt == self.config.max_retries - 1:
-                    raise
-            except ET.ParseError as e:
-                raise ValueError(f"XML 파싱 오류: {e}")
+                        raise
+                except etree.XMLSyntaxError as e:
+                    raise ValueError(f"XML 파싱 오류: {e}")
         
         return None
     
@@ -102,6 +444,7 @@ class KiprisAPIClient:
     # Core Tools
     # =========================================================================
     
+    @_ttl_cached
     async def search_patents_by_applicant(
         self,
         applicant_name: str,
@@ -122,31 +465,30 @@ class KiprisAPIClient:
             검색 결과 딕셔너리
         """
         params = {
+            **_APPLICANT_SEARCH_BASE,
             "applicant": applicant_name,
             "docsStart": str(page),
             "docsCount": str(min(page_size, 500)),
-            "patent": "true",
-            "utility": "false",
             "lastvalue": status
         }
         
-        root = await self._make_request(
+        records = await self._make_request(
             self.ENDPOINTS["applicant_search"], 
-            params
+            params,
+            ("TotalSearchCount", "PatentUtilityInfo")
         )
         
-        if root is None:
+        if records is None:
             return {"patents": [], "total_count": 0, "page": page}
         
-        # 전체 건수
-        total_elem = root.find(".//TotalSearchCount")
-        total_count = int(total_elem.text) if (total_elem is not None and total_elem.text) else 0
-        
-        # 특허 정보 추출
+        # 전체 건수 및 특허 정보 추출 (단일 패스)
+        total_count = 0
         patents = []
-        for item in root.findall(".//PatentUtilityInfo"):
-            patent = self._parse_patent_info(item)
-            patents.append(patent)
+        for tag, fields in records:
+            if tag == "PatentUtilityInfo":
+                patents.append(self._parse_patent_info(fields))
+            elif fields.get(tag):
+                total_count = int(fields[tag])
         
         return {
             "patents": patents,
@@ -157,10 +499,11 @@ class KiprisAPIClient:
             "next_page": page + 1 if (page * page_size) < total_count else None
         }
     
+    @_ttl_cached
     async def get_patent_detail(
         self,
         application_number: str
-    ) -> Optional[Dict[str, Any]]:
+    ) -> Optional[PatentDetail]:
         """
         출원번호로 특허 상세 정보 조회
         
@@ -168,31 +511,55 @@ class KiprisAPIClient:
             application_number: 출원번호 (예: "1020200123456")
             
         Returns:
-            특허 상세 정보 딕셔너리
+            특허 상세 정보 (없으면 None)
         """
         params = {
-            "applicationNumber": application_number,
-            "docsStart": "1"
+            **_PATENT_INFO_BASE,
+            "applicationNumber": application_number
         }
         
-        root = await self._make_request(
+        records = await self._make_request(
             self.ENDPOINTS["patent_info"],
-            params
+            params,
+            ("PatentUtilityInfo",)
         )
         
-        if root is None:
+        if not records:
             return None
         
-        item = root.find(".//PatentUtilityInfo")
-        if item is None:
-            return None
+        _, fields = records[0]
+        return self._parse_patent_info(fields, detailed=True)
+    
+    async def get_patent_details_bulk(
+        self,
+        application_numbers: List[str],
+        concurrency: int = 10
+    ) -> Dict[str, Optional[PatentDetail]]:
+        """
+        여러 출원번호의 특허 상세 정보를 동시에 조회
+        
+        Args:
+            application_numbers: 출원번호 목록 (중복은 한 번만 조회)
+            concurrency: 동시에 실행할 최대 요청 수
+            
+        Returns:
+            {출원번호: 특허 상세 정보 또는 None} 딕셔너리 (입력 순서 유지)
+        """
+        numbers = list(dict.fromkeys(application_numbers))
+        sem = asyncio.Semaphore(concurrency)
         
-        return self._parse_patent_info(item, detailed=True)
+        async def fetch(number: str) -> Optional[PatentDetail]:
+            async with sem:
+                return await self.get_patent_detail(number)
+        
+        results = await asyncio.gather(*(fetch(number) for number in numbers))
+        return dict(zip(numbers, results))
     
+    @_ttl_cached
     async def get_citing_patents(
         self,
         application_number: str
-    ) -> List[Dict[str, Any]]:
+    ) -> List[Citation]:
         """
         특정 특허를 인용한 후행 특허 조회
         
@@ -206,27 +573,19 @@ class KiprisAPIClient:
             "standardCitationApplicationNumber": application_number
         }
         
-        root = await self._make_request(
+        records = await self._make_request(
             self.ENDPOINTS["citing_info"],
-            params
+            params,
+            ("citingInfo",)
         )
         
-        if root is None:
+        if records is None:
             return []
         
-        citing_patents = []
-        for item in root.findall(".//citingInfo"):
-            citing_info = {
-                "citing_application_number": self._get_text(item, "ApplicationNumber"),
-                "standard_citation_number": self._get_text(item, "StandardCitationApplicationNumber"),
-                "status_code": self._get_text(item, "StandardStatusCode"),
-                "status_name": self._get_text(item, "StandardStatusCodeName"),
-                "citation_type_code": self._get_text(item, "CitationLiteratureTypeCode"),
-                "citation_type_name": self._get_text(item, "CitationLiteratureTypeCodeName"),
-            }
-            citing_patents.append(citing_info)
-        
-        return citing_patents
+        return [
+            Citation(**{key: fields.get(tag) for key, tag in _CITING_FIELDS})
+            for _, fields in records
+        ]
     
     # =========================================================================
     # Helper Methods
@@ -234,39 +593,13 @@ class KiprisAPIClient:
     
     def _parse_patent_info(
         self, 
-        item: ET.Element, 
+        fields: Dict[str, Optional[str]], 
         detailed: bool = False
-    ) -> Dict[str, Any]:
-        """특허 정보 XML 엘리먼트 파싱"""
-        patent = {
-            "application_number": self._get_text(item, "ApplicationNumber"),
-            "application_date": self._get_text(item, "ApplicationDate"),
-            "title": self._get_text(item, "InventionName"),
-            "applicant": self._get_text(item, "Applicant"),
-            "registration_status": self._get_text(item, "RegistrationStatus"),
-        }
-        
-        # 공개 정보
-        patent["opening_number"] = self._get_text(item, "OpeningNumber")
-        patent["opening_date"] = self._get_text(item, "OpeningDate")
-        
-        # 등록 정보
-        patent["registration_number"] = self._get_text(item, "RegistrationNumber")
-        patent["registration_date"] = self._get_text(item, "RegistrationDate")
-        
+    ) -> Patent:
+        """특허 정보 필드 딕셔너리 파싱"""
         if detailed:
-            patent["abstract"] = self._get_text(item, "Abstract")
-            patent["ipc_number"] = self._get_text(item, "InternationalpatentclassificationNumber")
-        
-        return patent
-    
-    @staticmethod
-    def _get_text(element: ET.Element, tag: str) -> Optional[str]:
-        """XML 엘리먼트에서 텍스트 추출"""
-        child = element.find(tag)
-        if child is not None and child.text:
-            return child.text.strip()
-        return None
+            return PatentDetail(**{key: fields.get(tag) for key, tag in _PATENT_DETAIL_FIELDS})
+        return Patent(**{key: fields.get(tag) for key, tag in _PATENT_FIELDS})
 
 
 # =========================================================================
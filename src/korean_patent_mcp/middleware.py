@@ -3,10 +3,20 @@ Smithery Config Middleware
 Smithery에서 전달되는 session configuration을 파싱하는 미들웨어
 """
 from contextvars import ContextVar
+from types import MappingProxyType
+from typing import Mapping
 from smithery.utils.config import parse_config_from_asgi_scope
 
+_EMPTY_CONFIG: Mapping = MappingProxyType({})
+
 # ContextVar를 정의하여 요청 간에 설정을 안전하게 전달
-smithery_context: ContextVar[dict] = ContextVar("smithery_config", default={})
+# 설정 객체는 여러 요청이 공유하므로 읽기 전용(MappingProxyType)으로 저장한다.
+smithery_context: ContextVar[Mapping] = ContextVar("smithery_config", default=_EMPTY_CONFIG)
+
+# 쿼리 스트링(bytes) -> 파싱된 설정 캐시
+# 같은 세션의 요청은 동일한 쿼리 스트링을 반복하므로 매번 다시 파싱하지 않는다.
+_QS_CACHE_MAX = 4096
+_qs_cache: dict[bytes, Mapping] = {}
 
 
 class SmitheryConfigMiddleware:
@@ -21,13 +31,22 @@ class SmitheryConfigMiddleware:
         self.app = app
     
     async def __call__(self, scope, receive, send):
-        config = {}
+        config = _EMPTY_CONFIG
         if scope.get('type') == 'http':
-            try:
-                # Smithery 설정 파싱
-                config = parse_config_from_asgi_scope(scope)
-            except Exception as e:
-                print(f"SmitheryConfigMiddleware: Error parsing config: {e}")
+            qs = scope.get('query_string', b'')
+            cached = _qs_cache.get(qs)
+            if cached is not None:
+                config = cached
+            else:
+                try:
+                    # Smithery 설정 파싱
+                    config = MappingProxyType(parse_config_from_asgi_scope(scope))
+                    if len(_qs_cache) >= _QS_CACHE_MAX:
+                        # 가장 먼저 들어온 항목부터 제거 (FIFO)
+                        del _qs_cache[next(iter(_qs_cache))]
+                    _qs_cache[qs] = config
+                except Exception as e:
+                    print(f"SmitheryConfigMiddleware: Error parsing config: {e}")
         
         # 파싱한 설정을 ContextVar에 저장 (도구에서 smithery_context.get()으로 꺼내 씀)
         token = smithery_context.set(config)
@@ -2,66 +2,150 @@
 Korean Patent MCP Server
 한국 특허정보 검색서비스를 위한 MCP 서버 (Smithery Container 배포용)
 """
-import json
+import asyncio
+import io
 import os
 import sys
-from typing import Optional
-
+import time
+import uuid
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional
+
+import orjson
 import uvicorn
 from mcp.server.fastmcp import FastMCP
+from pydantic import ConfigDict, ValidationError, validate_call
 from mcp.server.transport_security import TransportSecuritySettings
 from starlette.middleware.cors import CORSMiddleware
 
-from .kipris_api import KiprisAPIClient, KiprisConfig
+from .kipris_api import Citation, KiprisAPIClient, KiprisConfig, Patent, PatentDetail
 from .middleware import SmitheryConfigMiddleware, smithery_context
 
 
+# 일괄 상세 조회 시 한 번에 요청할 수 있는 최대 출원번호 수
+MAX_BULK_DETAILS = 20
+
+# kipris_batch 한 번에 보낼 수 있는 최대 하위 요청 수
+MAX_BATCH_REQUESTS = 20
+
+# 결과 건수가 이보다 많으면 직렬화/포맷팅을 워커 스레드에서 실행
+_OFFLOAD_THRESHOLD = 50
+
+# 상세 정보 markdown에 표시할 초록 최대 글자 수
+_ABSTRACT_PREVIEW = 500
+
+# 오류 메시지 템플릿
+_ERR = "❌ 오류: {}"
+_ERR_SEARCH = "❌ 검색 오류: {}"
+_ERR_LOOKUP = "❌ 조회 오류: {}"
+_ERR_INIT_DEFAULT = "API 클라이언트 초기화 실패. KIPRIS_API_KEY를 설정해주세요."
+_NOT_FOUND = "출원번호 `{}`에 해당하는 특허를 찾을 수 없습니다."
+_ERR_NOT_FOUND = "❌ " + _NOT_FOUND
+
+# 출원번호 정규화: 하이픈, 공백, 유니코드 대시류 제거
+_APP_NUM_STRIP = str.maketrans("", "", "- \u2010\u2013\u2014")
+
+
+def normalize_application_number(application_number: str) -> str:
+    """출원번호 정규화 (이미 숫자로만 이루어져 있으면 새 문자열을 만들지 않고 그대로 반환)"""
+    if application_number.isdigit():
+        return application_number
+    return application_number.translate(_APP_NUM_STRIP)
+
+
 # =========================================================================
 # Global Client
 # =========================================================================
 
-_kipris_client: Optional[KiprisAPIClient] = None
 _init_error: Optional[str] = None
 
+# 환경변수 API 키: .env는 kipris_api 임포트 시 로드되므로 모듈 로드 시 한 번만 읽고,
+# 세션 키 해석(_resolve_api_key)과 오류 경로(get_kipris_client) 모두 이 값을 쓴다
+_ENV_API_KEY = os.getenv("KIPRIS_API_KEY", "")
 
-def get_kipris_client() -> Optional[KiprisAPIClient]:
-    """KIPRIS API 클라이언트 가져오기"""
-    global _kipris_client, _init_error
-    
-    if _kipris_client is None and _init_error is None:
-        try:
-            config = KiprisConfig.from_env()
-            _kipris_client = KiprisAPIClient(config)
-        except ValueError as e:
-            _init_error = str(e)
-    
-    return _kipris_client
+# API 키별 클라이언트 (최대 개수를 넘으면 가장 오래 사용하지 않은 키의 클라이언트를 닫고 제거)
+_CLIENT_CACHE_MAX = 32
+_clients: "OrderedDict[str, KiprisAPIClient]" = OrderedDict()
 
+# 종료 중인 클라이언트 Task (Task 참조 유지)
+_closing: set = set()
 
-def get_init_error() -> Optional[str]:
-    return _init_error
+
+def _client_for(api_key: str) -> KiprisAPIClient:
+    """API 키별 클라이언트 (같은 키의 호출은 연결 풀과 조회 캐시를 공유)"""
+    client = _clients.get(api_key)
+    if client is not None:
+        _clients.move_to_end(api_key)
+        return client
+    
+    client = _clients[api_key] = KiprisAPIClient(KiprisConfig.from_env(api_key=api_key))
+    if len(_clients) > _CLIENT_CACHE_MAX:
+        _, evicted = _clients.popitem(last=False)
+        _schedule_close(evicted)
+    return client
 
 
-def init_client_with_key(api_key: str) -> None:
-    """API 키로 클라이언트 초기화"""
-    global _kipris_client, _init_error
+def _schedule_close(client: KiprisAPIClient) -> None:
+    """캐시에서 밀려난 클라이언트의 연결 풀을 진행 중인 요청이 끝난 뒤 닫는다"""
     try:
-        os.environ["KIPRIS_API_KEY"] = api_key
-        config = KiprisConfig(api_key=api_key)
-        _kipris_client = KiprisAPIClient(config)
-        _init_error = None
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        # 이벤트 루프 밖(서버 실행 전)에서는 HTTP 클라이언트가 아직 만들어지지 않았다
+        return
+    task = loop.create_task(client.close_when_idle())
+    _closing.add(task)
+    task.add_done_callback(_closing.discard)
+
+
+async def close_clients() -> None:
+    """캐시된 모든 클라이언트 종료 (서버 종료 시)"""
+    clients = list(_clients.values())
+    _clients.clear()
+    await asyncio.gather(
+        *(client.close() for client in clients),
+        *_closing,
+        return_exceptions=True
+    )
+
+
+def get_kipris_client(api_key: Optional[str] = None) -> Optional[KiprisAPIClient]:
+    """
+    KIPRIS API 클라이언트 가져오기
+    
+    Args:
+        api_key: 사용할 API 키 (None이면 환경변수 API 키)
+    
+    키가 없거나 KIPRIS_* 설정값이 잘못되었으면 None을 반환하고 사유를 get_init_error()에 기록한다.
+    """
+    global _init_error
+    try:
+        client = _client_for(_ENV_API_KEY if api_key is None else api_key)
     except ValueError as e:
         _init_error = str(e)
+        return None
+    
+    _init_error = None
+    return client
+
+
+def get_init_error() -> Optional[str]:
+    return _init_error
 
 
 # =========================================================================
 # Config Access Helpers (per-request configuration)
 # =========================================================================
 
-def get_request_config() -> dict:
-    """Get full config from current request context."""
+# 도구 호출마다 쓰이므로 ContextVar 조회 메서드를 미리 바인딩
+_current_config = smithery_context.get
+
+
+def get_request_config() -> Mapping[str, Any]:
+    """Get full config from current request context (read-only)."""
     # ContextVar에서 직접 설정을 가져옴 (middleware에서 저장한 값)
-    return smithery_context.get()
+    return _current_config()
 
 
 def get_config_value(key: str, default=None):
@@ -70,79 +154,131 @@ def get_config_value(key: str, default=None):
     return config.get(key, default)
 
 
+def _resolve_api_key() -> str:
+    """현재 요청의 API 키 (세션 설정 우선, 없으면 환경변수)"""
+    return _current_config().get("kiprisApiKey") or _ENV_API_KEY
+
+
+def resolve_client() -> Optional[KiprisAPIClient]:
+    """현재 요청의 API 키로 클라이언트 가져오기 (실패 사유는 get_init_error())"""
+    return get_kipris_client(_resolve_api_key())
+
+
 # =========================================================================
 # Formatting Helpers
 # =========================================================================
 
-def format_patent_markdown(patent: dict, detailed: bool = False) -> str:
-    lines = []
-    lines.append(f"### {patent.get('title', '제목 없음')}")
-    lines.append("")
-    lines.append(f"- **출원번호**: {patent.get('application_number', '-')}")
-    lines.append(f"- **출원일**: {patent.get('application_date', '-')}")
-    lines.append(f"- **출원인**: {patent.get('applicant', '-')}")
-    lines.append(f"- **등록상태**: {patent.get('registration_status', '-')}")
-    
-    if patent.get('opening_number'):
-        lines.append(f"- **공개번호**: {patent.get('opening_number')} ({patent.get('opening_date', '-')})")
-    if patent.get('registration_number'):
-        lines.append(f"- **등록번호**: {patent.get('registration_number')} ({patent.get('registration_date', '-')})")
-    if detailed:
-        if patent.get('ipc_number'):
-            lines.append(f"- **IPC 분류**: {patent.get('ipc_number')}")
-        if patent.get('abstract'):
-            lines.append("")
-            lines.append("**초록**:")
-            lines.append(f"> {patent.get('abstract')[:500]}...")
-    
-    return "\n".join(lines)
+# JSON으로 응답하는 response_format ('json_pretty'는 사람이 읽기 위한 들여쓰기 출력)
+_JSON_FORMATS = ("json", "json_pretty")
+
+
+def _dumps(obj: Any, pretty: bool = False) -> str:
+    """
+    JSON 직렬화 (orjson, 한글은 이스케이프 없이 UTF-8로 출력)
+    
+    도구 응답은 MCP 메시지 안에 문자열로 한 번 더 인코딩되므로 기본은 들여쓰기 없이 압축 출력한다.
+    """
+    if pretty:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return orjson.dumps(obj).decode()
+
+
+async def _render(size: int, func: Callable[..., str], *args: Any) -> str:
+    """
+    응답 문자열 생성
+    
+    결과가 크면 워커 스레드에서 실행하여 다른 동시 요청을 처리하는 이벤트 루프를 막지 않는다.
+    """
+    if size > _OFFLOAD_THRESHOLD:
+        return await asyncio.to_thread(func, *args)
+    return func(*args)
+
+
+def format_patent_markdown(patent: Patent, detailed: bool = False) -> str:
+    opening_number = patent.opening_number
+    registration_number = patent.registration_number
+    ipc_number = getattr(patent, 'ipc_number', None) if detailed else None
+    abstract = getattr(patent, 'abstract', None) if detailed else None
+    
+    return "".join((
+        f"### {patent.title or '제목 없음'}\n\n"
+        f"- **출원번호**: {patent.application_number or '-'}\n"
+        f"- **출원일**: {patent.application_date or '-'}\n"
+        f"- **출원인**: {patent.applicant or '-'}\n"
+        f"- **등록상태**: {patent.registration_status or '-'}",
+        f"\n- **공개번호**: {opening_number} ({patent.opening_date or '-'})" if opening_number else "",
+        f"\n- **등록번호**: {registration_number} ({patent.registration_date or '-'})" if registration_number else "",
+        f"\n- **IPC 분류**: {ipc_number}" if ipc_number else "",
+        f"\n\n**초록**:\n> {abstract[:_ABSTRACT_PREVIEW]}{'...' if len(abstract) > _ABSTRACT_PREVIEW else ''}"
+        if abstract else "",
+    ))
+
+
+def format_patent_details_markdown(details: dict) -> str:
+    buf = io.StringIO()
+    w = buf.write
+    w("## 특허 상세 조회 결과\n\n")
+    w(f"요청 {len(details)}건 중 **{sum(1 for p in details.values() if p)}**건 조회")
+    
+    for app_num, patent in details.items():
+        w("\n\n---\n\n")
+        if patent is None:
+            w(_ERR_NOT_FOUND.format(app_num))
+        else:
+            w(format_patent_markdown(patent, detailed=True))
+    
+    return buf.getvalue()
 
 
 def format_search_result_markdown(result: dict) -> str:
-    lines = []
-    lines.append("## 검색 결과")
-    lines.append("")
-    lines.append(f"총 **{result['total_count']:,}**건 중 {len(result['patents'])}건 표시 (페이지 {result['page']})")
-    lines.append("")
-    
-    if not result['patents']:
-        lines.append("검색 결과가 없습니다.")
-        return "\n".join(lines)
-    
-    for i, patent in enumerate(result['patents'], 1):
-        lines.append("---")
-        lines.append(f"**[{i}]** {patent.get('title', '제목 없음')}")
-        lines.append(f"- 출원번호: `{patent.get('application_number', '-')}`")
-        lines.append(f"- 출원인: {patent.get('applicant', '-')}")
-        lines.append(f"- 상태: {patent.get('registration_status', '-')}")
-        lines.append("")
+    patents = result['patents']
+    buf = io.StringIO()
+    w = buf.write
+    w("## 검색 결과\n\n")
+    w(f"총 **{result['total_count']:,}**건 중 {len(patents)}건 표시 (페이지 {result['page']})\n")
+    
+    if not patents:
+        w("\n검색 결과가 없습니다.")
+        return buf.getvalue()
+    
+    for i, patent in enumerate(patents, 1):
+        w(
+            f"\n---\n**[{i}]** {patent.title or '제목 없음'}\n"
+            f"- 출원번호: `{patent.application_number or '-'}`\n"
+            f"- 출원인: {patent.applicant or '-'}\n"
+            f"- 상태: {patent.registration_status or '-'}\n"
+        )
     
     if result.get('has_more'):
-        lines.append("---")
-        lines.append(f"📄 다음 페이지: `page={result['next_page']}`")
+        w(f"\n---\n📄 다음 페이지: `page={result['next_page']}`")
     
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
-def format_citing_patents_markdown(citations: list, base_app_num: str) -> str:
-    lines = []
-    lines.append("## 인용 특허 조회 결과")
-    lines.append("")
-    lines.append(f"기준 특허 `{base_app_num}`를 인용한 후행 특허: **{len(citations)}**건")
-    lines.append("")
+def _iter_citing_markdown(citations: List[Citation], base_app_num: str) -> Iterator[str]:
+    """인용 특허 markdown을 헤더와 레코드 단위 조각으로 생성"""
+    yield "## 인용 특허 조회 결과\n\n"
+    yield f"기준 특허 `{base_app_num}`를 인용한 후행 특허: **{len(citations)}**건\n"
     
     if not citations:
-        lines.append("이 특허를 인용한 후행 특허가 없습니다.")
-        return "\n".join(lines)
+        yield "\n이 특허를 인용한 후행 특허가 없습니다."
+        return
     
     for i, cite in enumerate(citations, 1):
-        lines.append("---")
-        lines.append(f"**[{i}]** 출원번호: `{cite.get('citing_application_number', '-')}`")
-        lines.append(f"- 상태: {cite.get('status_name', '-')} ({cite.get('status_code', '-')})")
-        lines.append(f"- 인용유형: {cite.get('citation_type_name', '-')}")
-        lines.append("")
-    
-    return "\n".join(lines)
+        yield (
+            f"\n---\n**[{i}]** 출원번호: `{cite.citing_application_number or '-'}`\n"
+            f"- 상태: {cite.status_name or '-'} ({cite.status_code or '-'})\n"
+            f"- 인용유형: {cite.citation_type_name or '-'}\n"
+        )
+
+
+def format_citing_patents_markdown(citations: List[Citation], base_app_num: str) -> str:
+    return "".join(_iter_citing_markdown(citations, base_app_num))
+
+
+def format_citing_patents_ndjson(citations: List[Citation]) -> str:
+    """인용 특허를 한 줄에 하나씩 JSON으로 직렬화 (NDJSON)"""
+    return b"\n".join(map(orjson.dumps, citations)).decode()
 
 
 # =========================================================================
@@ -158,6 +294,258 @@ transport_security = TransportSecuritySettings(
 mcp = FastMCP("korean_patent_mcp", transport_security=transport_security)
 
 
+# =========================================================================
+# Search Prefetch (다음 페이지를 미리 조회하여 캐시에 채움)
+# =========================================================================
+
+# 진행 중인 프리페치 Task (중복 실행 방지 및 Task 참조 유지)
+_prefetching: Dict[tuple, asyncio.Task] = {}
+
+
+async def _prefetch_page(
+    client: KiprisAPIClient,
+    applicant_name: str,
+    page: int,
+    page_size: int,
+    status: str
+) -> None:
+    try:
+        await client.search_patents_by_applicant(
+            applicant_name=applicant_name,
+            page=page,
+            page_size=page_size,
+            status=status
+        )
+    except Exception:
+        # 프리페치 실패는 무시 (실제 요청 시 다시 조회)
+        pass
+
+
+def _schedule_prefetch(
+    client: KiprisAPIClient,
+    applicant_name: str,
+    page: int,
+    page_size: int,
+    status: str,
+    result: dict
+) -> None:
+    """다음 검색 페이지를 백그라운드에서 조회하여 클라이언트 캐시에 채움"""
+    if not result.get('has_more'):
+        return
+    
+    for next_page in range(page + 1, page + 1 + client.config.prefetch_depth):
+        if (next_page - 1) * page_size >= result['total_count']:
+            break
+        key = (client, applicant_name, next_page, page_size, status)
+        if key in _prefetching:
+            continue
+        task = asyncio.create_task(
+            _prefetch_page(client, applicant_name, next_page, page_size, status)
+        )
+        _prefetching[key] = task
+        task.add_done_callback(lambda _, key=key: _prefetching.pop(key, None))
+
+
+# =========================================================================
+# Background Jobs (job_id 발급 후 polling으로 결과 조회)
+# =========================================================================
+
+# 작업 결과 보관 시간 (초) - 이 시간이 지난 작업은 정리된다
+JOB_TTL_SECONDS = 600
+_JOB_SWEEP_INTERVAL = 60
+
+# job_id -> (생성 시각, 검색 Task, 응답 형식)
+_jobs: dict = {}
+_job_sweeper: Optional[asyncio.Task] = None
+
+
+async def _sweep_jobs() -> None:
+    """만료된 작업을 주기적으로 정리 (진행 중인 작업은 취소)"""
+    while _jobs:
+        await asyncio.sleep(_JOB_SWEEP_INTERVAL)
+        now = time.monotonic()
+        for job_id, (created_at, task, _) in list(_jobs.items()):
+            if now - created_at > JOB_TTL_SECONDS:
+                task.cancel()
+                del _jobs[job_id]
+
+
+def _register_job(task: asyncio.Task, response_format: str) -> str:
+    """작업을 등록하고 job_id 반환"""
+    global _job_sweeper
+    # 조회되지 않은 채 만료된 작업의 예외가 경고로 남지 않도록 결과를 소비
+    task.add_done_callback(lambda t: t.cancelled() or t.exception())
+    job_id = uuid.uuid4().hex
+    _jobs[job_id] = (time.monotonic(), task, response_format)
+    if _job_sweeper is None or _job_sweeper.done():
+        _job_sweeper = asyncio.create_task(_sweep_jobs())
+    return job_id
+
+
+# =========================================================================
+# Tool Implementations (도구, 백그라운드 작업, 일괄 실행이 공유하는 조회/렌더링)
+# =========================================================================
+
+def _client_error() -> str:
+    """클라이언트를 만들 수 없을 때 반환할 오류 메시지"""
+    return _ERR.format(get_init_error() or _ERR_INIT_DEFAULT)
+
+
+async def _search(
+    client: KiprisAPIClient,
+    applicant_name: str,
+    page: int = 1,
+    page_size: int = 20,
+    status: Optional[str] = None
+) -> dict:
+    """출원인 검색 (page_size 상한 적용 후 다음 페이지 프리페치 예약)"""
+    page_size = min(page_size, 100)
+    status = status or ""
+    result = await client.search_patents_by_applicant(
+        applicant_name=applicant_name,
+        page=page,
+        page_size=page_size,
+        status=status
+    )
+    _schedule_prefetch(client, applicant_name, page, page_size, status, result)
+    return result
+
+
+async def _citing(client: KiprisAPIClient, application_number: str) -> dict:
+    """인용 특허 조회 결과를 기준 출원번호와 함께 반환"""
+    app_num = normalize_application_number(application_number)
+    result = await client.get_citing_patents(app_num)
+    return {
+        "base_application_number": app_num,
+        "citing_count": len(result),
+        "citing_patents": result
+    }
+
+
+async def _render_search(result: dict, response_format: str) -> str:
+    size = len(result['patents'])
+    if response_format in _JSON_FORMATS:
+        return await _render(size, _dumps, result, response_format == "json_pretty")
+    return await _render(size, format_search_result_markdown, result)
+
+
+async def _render_citing(payload: dict, response_format: str) -> str:
+    citations = payload["citing_patents"]
+    if response_format in _JSON_FORMATS:
+        return await _render(len(citations), _dumps, payload, response_format == "json_pretty")
+    if response_format == "ndjson":
+        return await _render(len(citations), format_citing_patents_ndjson, citations)
+    return await _render(
+        len(citations),
+        format_citing_patents_markdown,
+        citations,
+        payload["base_application_number"]
+    )
+
+
+async def _impl_search(
+    client: KiprisAPIClient,
+    applicant_name: str,
+    page: int,
+    page_size: int,
+    status: Optional[str],
+    response_format: str
+) -> str:
+    try:
+        result = await _search(client, applicant_name, page, page_size, status)
+        return await _render_search(result, response_format)
+    except Exception as e:
+        return _ERR_SEARCH.format(e)
+
+
+async def _impl_detail(
+    client: KiprisAPIClient,
+    application_number: str,
+    response_format: str
+) -> str:
+    try:
+        result = await client.get_patent_detail(normalize_application_number(application_number))
+        if result is None:
+            return _ERR_NOT_FOUND.format(application_number)
+        
+        if response_format in _JSON_FORMATS:
+            return _dumps(result, response_format == "json_pretty")
+        return format_patent_markdown(result, detailed=True)
+    except Exception as e:
+        return _ERR_LOOKUP.format(e)
+
+
+async def _impl_details(
+    client: KiprisAPIClient,
+    application_numbers: List[str],
+    response_format: str
+) -> str:
+    app_nums = [normalize_application_number(num) for num in application_numbers]
+    
+    try:
+        result = await client.get_patent_details_bulk(app_nums)
+        
+        if response_format in _JSON_FORMATS:
+            return _dumps({
+                "patents": [patent for patent in result.values() if patent],
+                "not_found": [num for num, patent in result.items() if patent is None]
+            }, response_format == "json_pretty")
+        return format_patent_details_markdown(result)
+    except Exception as e:
+        return _ERR_LOOKUP.format(e)
+
+
+async def _impl_citing(
+    client: KiprisAPIClient,
+    application_number: str,
+    response_format: str
+) -> str:
+    try:
+        payload = await _citing(client, application_number)
+        return await _render_citing(payload, response_format)
+    except Exception as e:
+        return _ERR_LOOKUP.format(e)
+
+
+async def _batch_detail(client: KiprisAPIClient, application_number: str) -> PatentDetail:
+    result = await client.get_patent_detail(normalize_application_number(application_number))
+    if result is None:
+        raise ValueError(_NOT_FOUND.format(application_number))
+    return result
+
+
+# 하위 요청 인자를 개별 도구와 같은 규칙(pydantic)으로 검증/변환한 뒤 호출
+# (알 수 없는 인자, 누락된 필수 인자, 잘못된 타입은 ValidationError)
+_validated = validate_call(config=ConfigDict(arbitrary_types_allowed=True))
+
+# kipris_batch 하위 요청의 tool 이름 -> 처리 코루틴
+_BATCH_DISPATCH = {
+    "kipris_search_patents": _validated(_search),
+    "kipris_get_patent_detail": _validated(_batch_detail),
+    "kipris_get_citing_patents": _validated(_citing),
+}
+
+
+def _batch_size(results: List[dict]) -> int:
+    """일괄 실행 결과의 전체 레코드 수 (검색/인용 결과는 목록 길이, 나머지는 1건)"""
+    size = 0
+    for result in results:
+        data = result.get("data")
+        if isinstance(data, dict):
+            size += len(data.get("patents") or data.get("citing_patents") or ()) or 1
+        else:
+            size += 1
+    return size
+
+
+def _args_error(tool: str, error: ValidationError) -> str:
+    """인자 검증 오류를 '인자: 사유' 목록으로 변환"""
+    details = "; ".join(
+        f"{'.'.join(map(str, err['loc']))}: {err['msg']}" for err in error.errors()
+    )
+    return f"{tool} 인자 오류 - {details}"
+
+
 # =========================================================================
 # Tool Definitions
 # =========================================================================
@@ -177,31 +565,70 @@ async def kipris_search_patents(
         page: 페이지 번호 (기본값: 1)
         page_size: 페이지당 결과 수 (기본값: 20, 최대: 100)
         status: 상태 필터 ('A': 공개, 'R': 등록, 'J': 거절, None: 전체)
-        response_format: 응답 형식 ('markdown' 또는 'json')
+        response_format: 응답 형식 ('markdown', 'json' 또는 'json_pretty')
     """
-    # Get API key from session config or environment
-    api_key = get_config_value("kiprisApiKey") or os.getenv("KIPRIS_API_KEY", "")
-    if api_key:
-        init_client_with_key(api_key)
+    client = resolve_client()
+    if client is None:
+        return _client_error()
+    return await _impl_search(client, applicant_name, page, page_size, status, response_format)
+
+
+@mcp.tool(name="kipris_search_patents_start")
+async def kipris_search_patents_start(
+    applicant_name: str,
+    page: int = 1,
+    page_size: int = 20,
+    status: Optional[str] = None,
+    response_format: str = "markdown"
+) -> str:
+    """출원인명 특허 검색을 백그라운드 작업으로 시작하고 job_id를 반환합니다.
+    
+    결과가 많아 응답이 오래 걸리는 검색에 사용합니다. 반환된 job_id로
+    kipris_poll_job을 호출하여 결과를 받습니다.
     
-    client = get_kipris_client()
+    Args:
+        applicant_name: 출원인명 (필수, 예: '삼성전자', '카카오뱅크')
+        page: 페이지 번호 (기본값: 1)
+        page_size: 페이지당 결과 수 (기본값: 20, 최대: 100)
+        status: 상태 필터 ('A': 공개, 'R': 등록, 'J': 거절, None: 전체)
+        response_format: 결과 응답 형식 ('markdown', 'json' 또는 'json_pretty')
+    """
+    client = resolve_client()
     if client is None:
-        error = get_init_error() or "API 클라이언트 초기화 실패. KIPRIS_API_KEY를 설정해주세요."
-        return f"❌ 오류: {error}"
+        return _client_error()
+    
+    task = asyncio.create_task(_search(client, applicant_name, page, page_size, status))
+    job_id = _register_job(task, response_format)
     
+    if response_format in _JSON_FORMATS:
+        return _dumps({"job_id": job_id, "status": "pending"})
+    return f"⏳ 검색 작업을 시작했습니다. job_id: `{job_id}`\n`kipris_poll_job`으로 결과를 조회하세요."
+
+
+@mcp.tool(name="kipris_poll_job")
+async def kipris_poll_job(job_id: str) -> str:
+    """백그라운드 검색 작업의 결과를 조회합니다.
+    
+    작업이 끝나면 결과를 반환하고 작업은 삭제됩니다.
+    
+    Args:
+        job_id: kipris_search_patents_start가 반환한 작업 ID (필수)
+    """
+    job = _jobs.get(job_id)
+    if job is None:
+        return f"❌ 작업 `{job_id}`을(를) 찾을 수 없습니다. 만료되었거나 이미 결과를 조회했습니다."
+    
+    _, task, response_format = job
+    if not task.done():
+        if response_format in _JSON_FORMATS:
+            return _dumps({"job_id": job_id, "status": "pending"})
+        return f"⏳ 작업 `{job_id}`이(가) 아직 진행 중입니다. 잠시 후 다시 조회하세요."
+    
+    del _jobs[job_id]
     try:
-        result = await client.search_patents_by_applicant(
-            applicant_name=applicant_name,
-            page=page,
-            page_size=min(page_size, 100),
-            status=status or ""
-        )
-        
-        if response_format == "json":
-            return json.dumps(result, ensure_ascii=False, indent=2)
-        return format_search_result_markdown(result)
+        return await _render_search(task.result(), response_format)
     except Exception as e:
-        return f"❌ 검색 오류: {str(e)}"
+        return _ERR_SEARCH.format(e)
 
 
 @mcp.tool(name="kipris_get_patent_detail")
@@ -213,29 +640,34 @@ async def kipris_get_patent_detail(
     
     Args:
         application_number: 출원번호 (필수, 예: '1020200123456')
-        response_format: 응답 형식 ('markdown' 또는 'json')
+        response_format: 응답 형식 ('markdown', 'json' 또는 'json_pretty')
     """
-    # Get API key from session config or environment
-    api_key = get_config_value("kiprisApiKey") or os.getenv("KIPRIS_API_KEY", "")
-    if api_key:
-        init_client_with_key(api_key)
-    
-    client = get_kipris_client()
+    client = resolve_client()
     if client is None:
-        return f"❌ 오류: {get_init_error() or 'API 클라이언트 초기화 실패'}"
+        return _client_error()
+    return await _impl_detail(client, application_number, response_format)
+
+
+@mcp.tool(name="kipris_get_patent_details")
+async def kipris_get_patent_details(
+    application_numbers: List[str],
+    response_format: str = "markdown"
+) -> str:
+    """여러 출원번호의 특허 상세 정보를 한 번에 조회합니다.
     
-    app_num = application_number.replace("-", "")
+    Args:
+        application_numbers: 출원번호 목록 (필수, 최대 20개, 예: ['1020200123456', '1020180056789'])
+        response_format: 응답 형식 ('markdown', 'json' 또는 'json_pretty')
+    """
+    if not application_numbers:
+        return _ERR.format("조회할 출원번호를 1개 이상 입력해주세요.")
+    if len(application_numbers) > MAX_BULK_DETAILS:
+        return _ERR.format(f"한 번에 최대 {MAX_BULK_DETAILS}개의 출원번호만 조회할 수 있습니다.")
     
-    try:
-        result = await client.get_patent_detail(app_num)
-        if result is None:
-            return f"❌ 출원번호 `{application_number}`에 해당하는 특허를 찾을 수 없습니다."
-        
-        if response_format == "json":
-            return json.dumps(result, ensure_ascii=False, indent=2)
-        return format_patent_markdown(result, detailed=True)
-    except Exception as e:
-        return f"❌ 조회 오류: {str(e)}"
+    client = resolve_client()
+    if client is None:
+        return _client_error()
+    return await _impl_details(client, application_numbers, response_format)
 
 
 @mcp.tool(name="kipris_get_citing_patents")
@@ -247,37 +679,128 @@ async def kipris_get_citing_patents(
     
     Args:
         application_number: 기준 특허의 출원번호 (필수)
-        response_format: 응답 형식 ('markdown' 또는 'json')
+        response_format: 응답 형식 ('markdown', 'json', 'json_pretty' 또는 'ndjson': 인용 특허당 한 줄)
+    """
+    client = resolve_client()
+    if client is None:
+        return _client_error()
+    return await _impl_citing(client, application_number, response_format)
+
+
+@mcp.tool(name="kipris_batch")
+async def kipris_batch(
+    requests: List[Dict[str, Any]],
+    max_parallel: int = 10
+) -> str:
+    """여러 조회 요청을 한 번의 호출로 동시에 실행하고 결과를 JSON 목록으로 반환합니다.
+    
+    동일한 하위 요청은 한 번만 실행됩니다. 결과는 요청 순서대로
+    {"ok": true, "data": ...} 또는 {"ok": false, "error": "..."} 형식입니다.
+    
+    tool별 args (결과는 항상 JSON이므로 response_format은 무시됩니다):
+    - kipris_search_patents: applicant_name (필수), page, page_size, status
+    - kipris_get_patent_detail: application_number (필수)
+    - kipris_get_citing_patents: application_number (필수)
+    
+    Args:
+        requests: 하위 요청 목록 (필수, 최대 20개). 각 항목은 {"tool": 이름, "args": 인자}
+            (예: [{"tool": "kipris_get_patent_detail", "args": {"application_number": "1020200123456"}}])
+        max_parallel: 동시에 실행할 최대 요청 수 (기본값: 10)
     """
-    # Get API key from session config or environment
-    api_key = get_config_value("kiprisApiKey") or os.getenv("KIPRIS_API_KEY", "")
-    if api_key:
-        init_client_with_key(api_key)
+    if not requests:
+        return _ERR.format("실행할 요청을 1개 이상 입력해주세요.")
+    if len(requests) > MAX_BATCH_REQUESTS:
+        return _ERR.format(f"한 번에 최대 {MAX_BATCH_REQUESTS}개의 요청만 실행할 수 있습니다.")
     
-    client = get_kipris_client()
+    client = resolve_client()
     if client is None:
-        return f"❌ 오류: {get_init_error() or 'API 클라이언트 초기화 실패'}"
+        return _client_error()
     
-    app_num = application_number.replace("-", "")
+    sem = asyncio.Semaphore(max(1, max_parallel))
     
-    try:
-        result = await client.get_citing_patents(app_num)
-        
-        if response_format == "json":
-            return json.dumps({
-                "base_application_number": app_num,
-                "citing_count": len(result),
-                "citing_patents": result
-            }, ensure_ascii=False, indent=2)
-        return format_citing_patents_markdown(result, app_num)
-    except Exception as e:
-        return f"❌ 조회 오류: {str(e)}"
+    async def run(tool: Any, args: Any) -> dict:
+        handler = _BATCH_DISPATCH.get(tool) if isinstance(tool, str) else None
+        if handler is None:
+            return {"ok": False, "error": f"지원하지 않는 tool: {tool}"}
+        if not isinstance(args, dict):
+            return {"ok": False, "error": "args는 객체여야 합니다."}
+        # 결과는 항상 JSON으로 반환하므로 response_format은 무시
+        args = {name: value for name, value in args.items() if name != "response_format"}
+        async with sem:
+            try:
+                return {"ok": True, "data": await handler(client, **args)}
+            except ValidationError as e:
+                return {"ok": False, "error": _args_error(tool, e)}
+            except Exception as e:
+                return {"ok": False, "error": str(e)}
+    
+    # 동일한 하위 요청은 한 번만 실행
+    pending: Dict[bytes, Any] = {}
+    keys = []
+    for item in requests:
+        tool = item.get("tool") if isinstance(item, dict) else None
+        args = item.get("args", {}) if isinstance(item, dict) else None
+        key = orjson.dumps([tool, args], option=orjson.OPT_SORT_KEYS)
+        if key not in pending:
+            pending[key] = run(tool, args)
+        keys.append(key)
+    
+    outcomes = dict(zip(pending, await asyncio.gather(*pending.values())))
+    results = [outcomes[key] for key in keys]
+    return await _render(_batch_size(results), _dumps, {"results": results})
 
 
 # =========================================================================
 # Server Entry Point
 # =========================================================================
 
+@lru_cache(maxsize=1)
+def create_http_app():
+    """
+    HTTP 모드용 ASGI 앱 생성 (프로세스당 한 번만 생성하여 재사용)
+    
+    streamable HTTP 앱에 CORS와 Smithery 설정 미들웨어를 적용한다.
+    """
+    # Setup Starlette app with streamable HTTP
+    # DNS rebinding protection is disabled via transport_security above
+    app = mcp.streamable_http_app()
+    
+    # 서버 종료 시 API 키별 클라이언트의 연결 풀을 닫는다
+    session_lifespan = app.router.lifespan_context
+    
+    @asynccontextmanager
+    async def lifespan(app):
+        async with session_lifespan(app):
+            try:
+                yield
+            finally:
+                await close_clients()
+    
+    app.router.lifespan_context = lifespan
+    
+    # IMPORTANT: Add CORS middleware for browser-based clients
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["*"],
+        allow_credentials=True,
+        allow_methods=["GET", "POST", "OPTIONS", "DELETE"],
+        allow_headers=["*"],
+        expose_headers=["mcp-session-id", "mcp-protocol-version"],
+        max_age=86400,
+    )
+    
+    # Apply SmitheryConfigMiddleware for per-request config extraction
+    return SmitheryConfigMiddleware(app)
+
+
+async def _run_stdio() -> None:
+    """stdio 모드 실행 (종료 시 클라이언트 연결 풀 정리)"""
+    try:
+        await mcp.run_stdio_async()
+    finally:
+        await close_clients()
+
+
 def main():
     """서버 실행 진입점"""
     transport_mode = os.getenv("TRANSPORT", "stdio")
@@ -286,33 +809,27 @@ def main():
         # HTTP mode for Smithery Container deployment
         print("Korean Patent MCP Server starting in HTTP mode...", file=sys.stderr)
         
-        # Setup Starlette app with streamable HTTP
-        # DNS rebinding protection is disabled via transport_security above
-        app = mcp.streamable_http_app()
-        
-        # IMPORTANT: Add CORS middleware for browser-based clients
-        app.add_middleware(
-            CORSMiddleware,
-            allow_origins=["*"],
-            allow_credentials=True,
-            allow_methods=["GET", "POST", "OPTIONS", "DELETE"],
-            allow_headers=["*"],
-            expose_headers=["mcp-session-id", "mcp-protocol-version"],
-            max_age=86400,
-        )
-        
-        # Apply SmitheryConfigMiddleware for per-request config extraction
-        app = SmitheryConfigMiddleware(app)
+        app = create_http_app()
         
         # Use Smithery-required PORT environment variable
         port = int(os.environ.get("PORT", 8081))
         print(f"Listening on port {port}", file=sys.stderr)
         
-        uvicorn.run(app, host="0.0.0.0", port=port, log_level="debug")
+        # debug 로그와 요청별 access log는 처리량을 떨어뜨리므로 환경변수로 켤 때만 사용
+        uvicorn.run(
+            app,
+            host="0.0.0.0",
+            port=port,
+            log_level=os.getenv("LOG_LEVEL", "info").lower(),
+            access_log=os.getenv("ACCESS_LOG", "0") == "1",
+            # C 구현 이벤트 루프(uvloop)와 HTTP 파서(httptools) 사용 (uvloop은 Windows 미지원)
+            loop="uvloop" if sys.platform != "win32" else "asyncio",
+            http="httptools",
+        )
     else:
         # Default stdio mode for local development
         print("Korean Patent MCP Server starting in stdio mode...", file=sys.stderr)
-        mcp.run()
+        asyncio.run(_run_stdio())
 
 
 if __name__ == "__main__":
@@ -0,0 +1,66 @@
+"""
+테스트 공용 fixture: httpx.MockTransport로 KIPRIS API 응답을 흉내 낸다
+"""
+import asyncio
+from typing import Callable, List, Optional
+
+import httpx
+import pytest
+
+from korean_patent_mcp import kipris_api
+from korean_patent_mcp.kipris_api import KiprisAPIClient, KiprisConfig
+
+
+class MockKipris:
+    """
+    요청을 기록하는 가짜 KIPRIS 서버
+
+    gate가 설정되어 있으면 응답 전에 gate가 열릴 때까지 기다려 동시 요청을 재현한다.
+    """
+
+    def __init__(self, respond: Callable[[httpx.Request], bytes]):
+        self.respond = respond
+        self.requests: List[httpx.Request] = []
+        self.gate: Optional[asyncio.Event] = None
+        self.started = asyncio.Event()
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        self.started.set()
+        if self.gate is not None:
+            await self.gate.wait()
+        return httpx.Response(200, content=self.respond(request))
+
+
+class FakeClock:
+    """_TTLCache가 쓰는 monotonic 대체"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def make_client():
+    """MockKipris 응답 함수로 (KiprisAPIClient, MockKipris) 생성"""
+
+    def factory(respond: Callable[[httpx.Request], bytes], **config):
+        server = MockKipris(respond)
+        client = KiprisAPIClient(KiprisConfig(api_key="test-key", **config))
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(server))
+        return client, server
+
+    return factory
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    # time.monotonic 자체를 바꾸면 이벤트 루프 시계도 멈추므로 kipris_api가 가져온 이름만 교체
+    fake = FakeClock()
+    monkeypatch.setattr(kipris_api, "monotonic", fake)
+    return fake
@@ -0,0 +1,44 @@
+"""
+테스트용 KIPRIS API 응답 본문 생성
+"""
+from typing import List
+
+
+def patent_xml(application_number: str, title: str = "배터리") -> bytes:
+    """특허 1건을 담은 응답 본문"""
+    return (
+        "<response><body><items><PatentUtilityInfo>"
+        f"<ApplicationNumber>{application_number}</ApplicationNumber>"
+        f"<InventionName>{title}</InventionName>"
+        "</PatentUtilityInfo></items></body></response>"
+    ).encode()
+
+
+def search_xml(total_count: int, application_numbers: List[str]) -> bytes:
+    """출원인 검색 응답 본문"""
+    items = "".join(
+        "<PatentUtilityInfo>"
+        f"<ApplicationNumber>{number}</ApplicationNumber>"
+        "</PatentUtilityInfo>"
+        for number in application_numbers
+    )
+    return (
+        "<response><body><items>"
+        f"<TotalSearchCount>{total_count}</TotalSearchCount>{items}"
+        "</items></body></response>"
+    ).encode()
+
+
+EMPTY_XML = b"<response><body><items></items></body></response>"
+
+
+def citing_xml(application_numbers: List[str]) -> bytes:
+    """인용 특허 조회 응답 본문"""
+    items = "".join(
+        "<citingInfo>"
+        f"<ApplicationNumber>{number}</ApplicationNumber>"
+        "<StandardStatusCodeName>등록</StandardStatusCodeName>"
+        "</citingInfo>"
+        for number in application_numbers
+    )
+    return f"<response><body><items>{items}</items></body></response>".encode()
@@ -0,0 +1,137 @@
+"""
+KiprisAPIClient 요청 병합(single-flight), TTL 캐시, 응답 파싱 테스트
+"""
+import asyncio
+import dataclasses
+
+import pytest
+from kipris_mock import EMPTY_XML, patent_xml, search_xml
+
+
+async def test_concurrent_identical_calls_issue_one_get(make_client):
+    client, server = make_client(lambda request: patent_xml("1020200123456"))
+    server.gate = asyncio.Event()
+
+    calls = [
+        asyncio.ensure_future(client.get_patent_detail("1020200123456"))
+        for _ in range(5)
+    ]
+    await server.started.wait()
+    server.gate.set()
+    results = await asyncio.gather(*calls)
+
+    assert len(server.requests) == 1
+    assert all(result.title == "배터리" for result in results)
+    assert not client._inflight
+
+
+async def test_cancelled_waiter_does_not_abort_shared_request(make_client):
+    client, server = make_client(lambda request: patent_xml("1020200123456"))
+    server.gate = asyncio.Event()
+
+    cancelled = asyncio.ensure_future(client.get_patent_detail("1020200123456"))
+    survivor = asyncio.ensure_future(client.get_patent_detail("1020200123456"))
+    await server.started.wait()
+
+    cancelled.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
+
+    server.gate.set()
+    result = await survivor
+
+    assert result.application_number == "1020200123456"
+    assert len(server.requests) == 1
+
+
+async def test_negative_result_expires_after_negative_ttl(make_client, clock):
+    found = False
+
+    def respond(request):
+        return patent_xml("1020200123456") if found else EMPTY_XML
+
+    client, server = make_client(respond, negative_cache_ttl=30)
+
+    assert await client.get_patent_detail("1020200123456") is None
+    clock.advance(29)
+    assert await client.get_patent_detail("1020200123456") is None
+    assert len(server.requests) == 1
+
+    found = True
+    clock.advance(2)
+    result = await client.get_patent_detail("1020200123456")
+
+    assert result.title == "배터리"
+    assert len(server.requests) == 2
+
+
+async def test_positive_result_uses_full_ttl(make_client, clock):
+    client, server = make_client(
+        lambda request: patent_xml("1020200123456"),
+        cache_ttl=3600,
+        negative_cache_ttl=30,
+    )
+
+    await client.get_patent_detail("1020200123456")
+    clock.advance(3599)
+    await client.get_patent_detail("1020200123456")
+    assert len(server.requests) == 1
+
+    clock.advance(2)
+    await client.get_patent_detail("1020200123456")
+    assert len(server.requests) == 2
+
+
+async def test_non_xml_response_raises_and_is_not_cached(make_client):
+    client, server = make_client(lambda request: b"SERVICE ERROR", max_retries=1)
+
+    with pytest.raises(ValueError, match="XML 파싱 오류"):
+        await client.get_patent_detail("1020200123456")
+    with pytest.raises(ValueError):
+        await client.get_patent_detail("1020200123456")
+
+    assert len(server.requests) == 2
+
+
+async def test_positional_keyword_and_default_calls_share_cache_entry(make_client):
+    client, server = make_client(lambda request: search_xml(1, ["1020200123456"]))
+
+    await client.search_patents_by_applicant("삼성전자")
+    await client.search_patents_by_applicant("삼성전자", 1, 20, "")
+    await client.search_patents_by_applicant(applicant_name="삼성전자", page_size=20)
+
+    assert len(server.requests) == 1
+    with pytest.raises(TypeError):
+        await client.search_patents_by_applicant(page=1)
+
+
+async def test_shared_records_are_immutable(make_client):
+    client, _ = make_client(lambda request: patent_xml("1020200123456"))
+
+    result = await client.get_patent_detail("1020200123456")
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        result.title = "변경"
+    assert (await client.get_patent_detail("1020200123456")).title == "배터리"
+
+
+async def test_closed_client_refuses_new_connection_pool(make_client):
+    client, server = make_client(lambda request: patent_xml("1020200123456"))
+    server.gate = asyncio.Event()
+
+    pending = asyncio.ensure_future(client.get_patent_detail("1020200123456"))
+    await server.started.wait()
+    closing = asyncio.ensure_future(client.close_when_idle())
+    await asyncio.sleep(0)
+    assert not closing.done()
+
+    server.gate.set()
+    assert (await pending).title == "배터리"
+    await closing
+
+    # 캐시된 결과는 계속 제공하고, 새 upstream 요청은 연결 풀을 다시 만들지 않는다
+    assert (await client.get_patent_detail("1020200123456")).title == "배터리"
+    with pytest.raises(RuntimeError):
+        await client.get_patent_detail("1020200999999")
+    assert client._client is None
+    assert len(server.requests) == 1
@@ -0,0 +1,236 @@
+"""
+서버 측 검색 프리페치, 일괄 실행(kipris_batch), 백그라운드 작업 테스트
+"""
+import asyncio
+from collections import OrderedDict
+from types import MappingProxyType
+from urllib.parse import parse_qs
+
+import orjson
+import pytest
+from kipris_mock import EMPTY_XML, citing_xml, patent_xml, search_xml
+
+from korean_patent_mcp import server
+from korean_patent_mcp.middleware import smithery_context
+
+
+def _query(request):
+    return {key: values[0] for key, values in parse_qs(request.url.query.decode()).items()}
+
+
+def _kipris_response(request):
+    """엔드포인트별 응답 (상세 조회는 '9'로 시작하는 출원번호를 없는 특허로 처리)"""
+    query = _query(request)
+    path = request.url.path
+    if path.endswith("applicantNameSearchInfo"):
+        return search_xml(1, ["1020200000001"])
+    if path.endswith("citingInfo"):
+        return citing_xml(["1020210000001", "1020210000002"])
+    number = query["applicationNumber"]
+    return EMPTY_XML if number.startswith("9") else patent_xml(number)
+
+
+@pytest.fixture
+def serve(make_client, monkeypatch):
+    """도구 호출이 MockKipris 클라이언트를 쓰도록 resolve_client 교체"""
+
+    def factory(respond=_kipris_response, **config):
+        client, mock = make_client(respond, **config)
+        monkeypatch.setattr(server, "resolve_client", lambda: client)
+        return client, mock
+
+    return factory
+
+
+@pytest.fixture(autouse=True)
+def fresh_jobs(monkeypatch):
+    """테스트마다 작업 저장소와 정리 Task를 새로 시작"""
+    monkeypatch.setattr(server, "_jobs", {})
+    monkeypatch.setattr(server, "_job_sweeper", None)
+
+
+def _page_response(request):
+    query = parse_qs(request.url.query.decode())
+    page = int(query["docsStart"][0])
+    return search_xml(45, [f"10202000000{page:02d}"])
+
+
+async def test_search_prefetches_next_page_into_cache(make_client):
+    client, mock = make_client(_page_response, prefetch_depth=1)
+
+    await server._search(client, "삼성전자", page=1, page_size=20)
+    await asyncio.gather(*list(server._prefetching.values()))
+    assert len(mock.requests) == 2
+
+    result = await server._search(client, "삼성전자", page=2, page_size=20)
+    await asyncio.gather(*list(server._prefetching.values()))
+
+    assert result["page"] == 2
+    # 2페이지는 캐시에서, 3페이지는 새 프리페치로 조회
+    assert len(mock.requests) == 3
+    assert not server._prefetching
+
+
+async def test_search_does_not_prefetch_past_last_page(make_client):
+    client, mock = make_client(_page_response, prefetch_depth=3)
+
+    await server._search(client, "삼성전자", page=2, page_size=20)
+    await asyncio.gather(*list(server._prefetching.values()))
+
+    # 전체 45건이므로 3페이지까지만 존재
+    assert len(mock.requests) == 2
+
+
+# =========================================================================
+# API 키 해석
+# =========================================================================
+
+def test_resolve_client_prefers_session_key_then_env_key(monkeypatch):
+    monkeypatch.setattr(server, "_clients", OrderedDict())
+    monkeypatch.setattr(server, "_ENV_API_KEY", "env-key")
+
+    assert server.resolve_client().config.api_key == "env-key"
+
+    token = smithery_context.set(MappingProxyType({"kiprisApiKey": "session-key"}))
+    try:
+        assert server.resolve_client().config.api_key == "session-key"
+    finally:
+        smithery_context.reset(token)
+
+    monkeypatch.setattr(server, "_ENV_API_KEY", "")
+    assert server.resolve_client() is None
+    assert "KIPRIS_API_KEY" in server.get_init_error()
+
+
+# =========================================================================
+# kipris_batch
+# =========================================================================
+
+async def test_batch_runs_identical_requests_once(serve):
+    _, mock = serve()
+    detail = {"tool": "kipris_get_patent_detail", "args": {"application_number": "1020200123456"}}
+
+    output = orjson.loads(await server.kipris_batch([
+        detail,
+        {"tool": "kipris_search_patents", "args": {"applicant_name": "삼성전자", "page": 1}},
+        detail,
+        {"tool": "kipris_search_patents", "args": {"page": 1, "applicant_name": "삼성전자"}},
+    ]))
+    results = output["results"]
+
+    assert len(results) == 4
+    assert all(result["ok"] for result in results)
+    assert results[0] == results[2]
+    assert results[0]["data"]["application_number"] == "1020200123456"
+    assert results[1]["data"]["total_count"] == 1
+    assert len(mock.requests) == 2
+
+
+async def test_batch_reports_errors_per_entry(serve):
+    serve()
+
+    results = orjson.loads(await server.kipris_batch([
+        {"tool": "kipris_get_citing_patents", "args": {"application_number": "10-2020-0123456"}},
+        {"tool": "kipris_unknown", "args": {}},
+        {"tool": ["kipris_search_patents"], "args": {}},
+        {"tool": "kipris_get_patent_detail", "args": ["1020200123456"]},
+        {"tool": "kipris_get_patent_detail", "args": {"application_number": "9999"}},
+        "not an object",
+    ]))["results"]
+
+    assert results[0]["ok"]
+    assert results[0]["data"]["base_application_number"] == "1020200123456"
+    assert results[0]["data"]["citing_count"] == 2
+    assert [result["ok"] for result in results[1:]] == [False] * 5
+    assert results[1]["error"] == "지원하지 않는 tool: kipris_unknown"
+    assert results[2]["error"].startswith("지원하지 않는 tool")
+    assert results[3]["error"] == "args는 객체여야 합니다."
+    assert "9999" in results[4]["error"]
+    assert results[5]["error"] == "지원하지 않는 tool: None"
+
+
+async def test_batch_validates_args_like_standalone_tools(serve):
+    _, mock = serve()
+
+    results = orjson.loads(await server.kipris_batch([
+        {"tool": "kipris_get_patent_detail", "args": {"application_number": 1}},
+        {"tool": "kipris_search_patents", "args": {"applicant_name": "a", "page_size": "5"}},
+        {"tool": "kipris_search_patents", "args": {"applicant_name": "a", "bogus": 1}},
+        {"tool": "kipris_get_citing_patents", "args": {}},
+        {"tool": "kipris_search_patents", "args": {"applicant_name": "b", "response_format": "json"}},
+    ]))["results"]
+
+    assert [result["ok"] for result in results] == [False, True, False, False, True]
+    assert results[0]["error"].startswith("kipris_get_patent_detail 인자 오류 - application_number")
+    assert results[2]["error"].startswith("kipris_search_patents 인자 오류 - bogus")
+    assert results[3]["error"].startswith("kipris_get_citing_patents 인자 오류 - application_number")
+    # 문자열 page_size는 정수로 변환되어 요청에 반영
+    assert _query(mock.requests[0])["docsCount"] == "5"
+    # pydantic 원문 오류(안내 URL 포함)가 아닌 요약 메시지
+    assert "errors.pydantic.dev" not in results[0]["error"]
+
+
+async def test_batch_rejects_empty_and_oversized_requests(serve):
+    _, mock = serve()
+    detail = {"tool": "kipris_get_patent_detail", "args": {"application_number": "1"}}
+
+    assert (await server.kipris_batch([])).startswith("❌")
+    assert (await server.kipris_batch([detail] * (server.MAX_BATCH_REQUESTS + 1))).startswith("❌")
+    assert not mock.requests
+
+
+# =========================================================================
+# Background Jobs
+# =========================================================================
+
+async def test_job_is_pending_then_returns_result_once(serve):
+    _, mock = serve()
+    mock.gate = asyncio.Event()
+
+    started = orjson.loads(
+        await server.kipris_search_patents_start("삼성전자", response_format="json")
+    )
+    job_id = started["job_id"]
+    assert started["status"] == "pending"
+
+    await mock.started.wait()
+    assert orjson.loads(await server.kipris_poll_job(job_id)) == {
+        "job_id": job_id, "status": "pending"
+    }
+
+    mock.gate.set()
+    await server._jobs[job_id][1]
+    result = orjson.loads(await server.kipris_poll_job(job_id))
+
+    assert result["total_count"] == 1
+    assert job_id not in server._jobs
+    assert (await server.kipris_poll_job(job_id)).startswith("❌")
+
+
+async def test_job_reports_search_error_on_poll(serve):
+    serve(lambda request: b"SERVICE ERROR", max_retries=1)
+
+    job_id = orjson.loads(
+        await server.kipris_search_patents_start("삼성전자", response_format="json")
+    )["job_id"]
+    await asyncio.gather(server._jobs[job_id][1], return_exceptions=True)
+
+    assert (await server.kipris_poll_job(job_id)).startswith("❌ 검색 오류: XML 파싱 오류")
+
+
+async def test_expired_jobs_are_swept_and_cancelled(serve, monkeypatch):
+    _, mock = serve()
+    mock.gate = asyncio.Event()
+    monkeypatch.setattr(server, "JOB_TTL_SECONDS", -1)
+    monkeypatch.setattr(server, "_JOB_SWEEP_INTERVAL", 0)
+
+    job_id = orjson.loads(
+        await server.kipris_search_patents_start("삼성전자", response_format="json")
+    )["job_id"]
+    task = server._jobs[job_id][1]
+    await server._job_sweeper
+
+    await asyncio.gather(task, return_exceptions=True)
+    assert job_id not in server._jobs
+    assert task.cancelled()
+    assert (await server.kipris_poll_job(job_id)).startswith("❌")